@@ -21,7 +21,7 @@ from tornado.escape import url_unescape, url_escape
 from tornado.routing import Rule, PathMatches, AnyMatches
 from tornado.http1connection import HTTP1Connection
 from tornado.log import access_log
-from utils import ServerError
+from utils import ServerError, json_dumps
 from websockets import WebRequest, WebsocketManager, WebSocket, APITransport
 from streaming_form_data import StreamingFormDataParser
 from streaming_form_data.targets import FileTarget, ValueTarget, SHA256Target
@@ -646,6 +646,12 @@ class DynamicRequestHandler(AuthorizedRequestHandler):
         if result is None:
             self.set_status(204)
         self._log_debug(f"HTTP Response::{req}", result)
+        if isinstance(result, dict):
+            # Encode with json_dumps rather than letting tornado fall
+            # back to the standard library encoder.  Escape "</" as
+            # tornado does.
+            self.set_header("Content-Type", "application/json; charset=UTF-8")
+            result = json_dumps(result).replace(b"</", b"<\\/")
         self.finish(result)
 
 class FileRequestHandler(AuthorizedFileHandler):
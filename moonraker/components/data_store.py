@@ -26,8 +26,11 @@ if TYPE_CHECKING:
     APIComp = klippy_apis.KlippyAPI
     GCQueue = Deque[Dict[str, Any]]
     TempStore = Dict[str, Dict[str, Deque[float]]]
+    StoreFields = Tuple[Tuple[int, Deque[float]], ...]
+    StoreItems = Tuple[Tuple[str, Deque[float], StoreFields], ...]
 
 TEMP_UPDATE_TIME = 1.
+TEMP_FIELDS = {'target': 1, 'power': 2, 'speed': 3}
 
 class DataStore:
     def __init__(self, config: ConfigHelper) -> None:
@@ -36,9 +39,10 @@ class DataStore:
         self.gcode_store_size = config.getint('gcode_store_size', 1000)
 
         # Temperature Store Tracking
-        self.last_temps: Dict[str, Tuple[float, ...]] = {}
+        self.last_temps: Dict[str, List[float]] = {}
         self.gcode_queue: GCQueue = deque(maxlen=self.gcode_store_size)
         self.temperature_store: TempStore = {}
+        self.store_items: StoreItems = ()
         eventloop = self.server.get_event_loop()
         self.temp_update_timer = eventloop.register_timer(
             self._update_temperature_store)
@@ -94,8 +98,9 @@ class DataStore:
                             new_store[sensor][f"{item}s"] = deque(
                                 maxlen=self.temp_store_size)
                 if sensor not in self.last_temps:
-                    self.last_temps[sensor] = (0., 0., 0., 0.)
+                    self.last_temps[sensor] = [0., 0., 0., 0.]
             self.temperature_store = new_store
+            self._build_store_items()
             # Prune unconfigured sensors in self.last_temps
             for sensor in list(self.last_temps.keys()):
                 if sensor not in self.temperature_store:
@@ -107,26 +112,46 @@ class DataStore:
             logging.info("No sensors found")
             self.last_temps = {}
             self.temperature_store = {}
+            self.store_items = ()
             self.temp_update_timer.stop()
 
+    def _build_store_items(self) -> None:
+        # Resolve the deques each sensor appends to once, rather
+        # than looking them up on every store update
+        items = []
+        for sensor, store in self.temperature_store.items():
+            fields = tuple(
+                (idx, store[item]) for idx, item in
+                enumerate(["targets", "powers", "speeds"], 1)
+                if item in store
+            )
+            items.append((sensor, store['temperatures'], fields))
+        self.store_items = tuple(items)
+
     def _set_current_temps(self, data: Dict[str, Any]) -> None:
+        last_temps = self.last_temps
         for sensor in self.temperature_store:
-            if sensor in data:
-                last_val = self.last_temps[sensor]
-                self.last_temps[sensor] = (
-                    round(data[sensor].get('temperature', last_val[0]), 2),
-                    data[sensor].get('target', last_val[1]),
-                    data[sensor].get('power', last_val[2]),
-                    data[sensor].get('speed', last_val[3]))
+            sensor_data: Optional[Dict[str, Any]] = data.get(sensor)
+            if sensor_data is None:
+                continue
+            # Status updates only carry the fields that changed,
+            # update the stored values in place
+            vals = last_temps[sensor]
+            for field, val in sensor_data.items():
+                if field == 'temperature':
+                    vals[0] = round(val, 2)
+                elif field in TEMP_FIELDS:
+                    vals[TEMP_FIELDS[field]] = val
 
     def _update_temperature_store(self, eventtime: float) -> float:
         # XXX - If klippy is not connected, set values to zero
         # as they are unknown?
-        for sensor, vals in self.last_temps.items():
-            self.temperature_store[sensor]['temperatures'].append(vals[0])
-            for val, item in zip(vals[1:], ["targets", "powers", "speeds"]):
-                if item in self.temperature_store[sensor]:
-                    self.temperature_store[sensor][item].append(val)
+        last_temps = self.last_temps
+        for sensor, temps, fields in self.store_items:
+            vals = last_temps[sensor]
+            temps.append(vals[0])
+            for idx, store in fields:
+                store.append(vals[idx])
         return eventtime + TEMP_UPDATE_TIME
 
     async def _handle_temp_store_request(self,
@@ -147,8 +172,7 @@ class DataStore:
 
     def store_gcode_command(self, script: str) -> None:
         curtime = time.time()
-        for cmd in script.split('\n'):
-            cmd = cmd.strip()
+        for cmd in map(str.strip, script.splitlines()):
             if not cmd:
                 continue
             self.gcode_queue.append(
@@ -813,7 +813,8 @@ class InotifyNode:
         self.parent_node = parent
         self.child_nodes: Dict[str, InotifyNode] = {}
         self.watch_desc = self.ihdlr.add_watch(self)
-        self.pending_node_events: Dict[str, asyncio.Handle] = {}
+        self.pending_node_events: Dict[str, asyncio.TimerHandle] = {}
+        self.event_deadlines: Dict[str, float] = {}
         self.pending_deleted_children: Set[Tuple[str, bool]] = set()
         self.pending_file_events: Dict[str, str] = {}
         self.is_processing_metadata = False
@@ -1001,17 +1002,47 @@ class InotifyNode:
         if evt_name in self.pending_node_events:
             self.reset_event(evt_name, timeout)
             return
-        callback = getattr(self, f"_finish_{evt_name}")
-        hdl = self.event_loop.delay_callback(timeout, callback)
-        self.pending_node_events[evt_name] = hdl
+        self._schedule_event(evt_name, timeout)
 
     def reset_event(self, evt_name: str, timeout: float) -> None:
         if evt_name in self.pending_node_events:
+            # Resets arrive for every inotify event in a bundle.  Rather
+            # than rescheduling the timer each time, push back the
+            # deadline and let the timer reschedule itself if it fires
+            # early.  A new timer is required if the handle was stopped,
+            # the new deadline is earlier, or the timer has already fired
+            # and its finish callback is pending.
             hdl = self.pending_node_events[evt_name]
-            hdl.cancel()
-            callback = getattr(self, f"_finish_{evt_name}")
-            hdl = self.event_loop.delay_callback(timeout, callback)
+            deadline = self.event_loop.get_loop_time() + timeout
+            if (
+                hdl.cancelled() or hdl.when() > deadline or
+                evt_name not in self.event_deadlines
+            ):
+                hdl.cancel()
+                self._schedule_event(evt_name, timeout)
+            else:
+                self.event_deadlines[evt_name] = deadline
+
+    def _schedule_event(self, evt_name: str, timeout: float) -> None:
+        eventloop = self.event_loop
+        self.event_deadlines[evt_name] = eventloop.get_loop_time() + timeout
+        hdl = eventloop.delay_callback(
+            timeout, self._check_event_deadline, evt_name)
+        self.pending_node_events[evt_name] = hdl
+
+    def _check_event_deadline(self, evt_name: str) -> None:
+        eventloop = self.event_loop
+        remaining = self.event_deadlines[evt_name] - eventloop.get_loop_time()
+        if remaining > 0.:
+            hdl = eventloop.delay_callback(
+                remaining, self._check_event_deadline, evt_name)
             self.pending_node_events[evt_name] = hdl
+            return
+        self.event_deadlines.pop(evt_name, None)
+        callback = getattr(self, f"_finish_{evt_name}")
+        ret = callback()
+        if ret is not None:
+            eventloop.create_task(ret)
 
     def stop_event(self, evt_name: str) -> None:
         if evt_name in self.pending_node_events:
@@ -1020,6 +1051,7 @@ class InotifyNode:
 
     def remove_event(self, evt_name: str) -> None:
         hdl = self.pending_node_events.pop(evt_name, None)
+        self.event_deadlines.pop(evt_name, None)
         if hdl is not None:
             hdl.cancel()
 
@@ -1028,6 +1060,7 @@ class InotifyNode:
             return
         hdl = self.pending_node_events['delete_child']
         hdl.cancel()
+        self.event_deadlines.pop('delete_child', None)
         self._finish_delete_child()
 
     def clear_events(self, include_children: bool = True) -> None:
@@ -1037,6 +1070,7 @@ class InotifyNode:
         for hdl in self.pending_node_events.values():
             hdl.cancel()
         self.pending_node_events.clear()
+        self.event_deadlines.clear()
         self.pending_deleted_children.clear()
         self.pending_file_events.clear()
 
@@ -211,6 +211,7 @@ class GpioEvent(GpioBase):
                  ) -> None:
         super().__init__(line, pin_params)
         self.event_loop = event_loop
+        self.get_loop_time = event_loop.get_loop_time
         self.fd = line.event_get_fd()
         self.callback = callback
         self.on_error: Optional[Callable[[str], None]] = None
@@ -234,7 +235,7 @@ class GpioEvent(GpioBase):
     def start(self) -> None:
         if not self.started:
             self.value = self.line.get_value()
-            self.last_event_time = self.event_loop.get_loop_time()
+            self.last_event_time = self.get_loop_time()
             self.event_loop.add_reader(self.fd, self._on_event_trigger)
             self.started = True
             logging.debug(f"GPIO {self.name}: Listening for events, "
@@ -256,7 +257,7 @@ class GpioEvent(GpioBase):
             self.value = 1
         elif evt.type == self.EVENT_FALLING_EDGE:
             self.value = 0
-        eventtime = self.event_loop.get_loop_time()
+        eventtime = self.get_loop_time()
         evt_duration = eventtime - self.last_event_time
         if last_val == self.value or evt_duration < self.min_evt_time:
             self._increment_error()
@@ -8,10 +8,12 @@ from __future__ import annotations
 import socket
 import asyncio
 import logging
+import random
 import json
 import pathlib
 from collections import deque
 import paho.mqtt.client as paho_mqtt
+from utils import json_dumps
 from websockets import Subscribable, WebRequest, JsonRPC, APITransport
 
 # Annotation imports
@@ -36,6 +38,7 @@ if TYPE_CHECKING:
     RPCCallback = Callable[..., Coroutine]
 
 DUP_API_REQ_CODE = -10000
+MAX_RECONNECT_DELAY = 300.
 MQTT_PROTOCOLS = {
     'v3.1': paho_mqtt.MQTTv31,
     'v3.1.1': paho_mqtt.MQTTv311,
@@ -291,8 +294,8 @@ class MQTTClient(APITransport, Subscribable):
                     hdl.callback, message.payload)
         else:
             logging.debug(
-                f"Unregistered MQTT Topic Received: {topic}, "
-                f"payload: {message.payload.decode()}")
+                "Unregistered MQTT Topic Received: %s, payload: %s",
+                topic, message.payload.decode())
 
     def _on_connect(self,
                     client: paho_mqtt.Client,
@@ -374,10 +377,13 @@ class MQTTClient(APITransport, Subscribable):
 
     async def _do_reconnect(self) -> None:
         logging.info("Attempting MQTT Reconnect")
-        self.event_loop
+        max_delay = 1.
         while True:
+            # Exponential backoff with full jitter prevents multiple
+            # clients from reconnecting to the broker in lockstep
+            max_delay = min(MAX_RECONNECT_DELAY, max_delay * 2.)
             try:
-                await asyncio.sleep(2.)
+                await asyncio.sleep(random.uniform(0., max_delay))
             except asyncio.CancelledError:
                 break
             try:
@@ -456,8 +462,8 @@ class MQTTClient(APITransport, Subscribable):
         pub_fut: asyncio.Future = asyncio.Future()
         if isinstance(payload, (dict, list)):
             try:
-                payload = json.dumps(payload)
-            except json.JSONDecodeError:
+                payload = json_dumps(payload)
+            except (TypeError, ValueError):
                 raise self.server.error(
                     "Dict or List is not json encodable") from None
         elif isinstance(payload, bool):
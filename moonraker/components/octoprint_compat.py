@@ -6,6 +6,7 @@
 
 from __future__ import annotations
 import logging
+import functools
 
 # Annotation imports
 from typing import (
@@ -13,6 +14,7 @@ from typing import (
     Any,
     Dict,
     List,
+    Optional,
 )
 if TYPE_CHECKING:
     from confighelper import ConfigHelper
@@ -22,6 +24,27 @@ if TYPE_CHECKING:
     from .job_queue import JobQueue
 
 OCTO_VERSION = '1.5.0'
+PRINTER_STATES = {
+    'standby': 'Operational',
+    'printing': 'Printing',
+    'paused': 'Paused',
+    'complete': 'Operational'
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _tool_id_for(heater: str) -> Optional[str]:
+    if heater == "extruder":
+        return 'tool0'
+    elif heater == "heater_bed":
+        return 'bed'
+    elif heater.startswith('extruder'):
+        try:
+            tool_no = int(heater[8:])
+        except ValueError:
+            tool_no = 0
+        return f'tool{tool_no}'
+    return None
 
 
 class OctoPrintCompat:
@@ -144,28 +167,18 @@ class OctoPrintCompat:
 
     def printer_state(self) -> str:
         klippy_state = self.server.get_klippy_state()
-        if klippy_state in ["disconnected", "startup"]:
+        if klippy_state in ("disconnected", "startup"):
             return 'Offline'
         elif klippy_state != 'ready':
             return 'Error'
-        return {
-            'standby': 'Operational',
-            'printing': 'Printing',
-            'paused': 'Paused',
-            'complete': 'Operational'
-        }.get(self.last_print_stats.get('state', 'standby'), 'Error')
+        return PRINTER_STATES.get(
+            self.last_print_stats.get('state', 'standby'), 'Error')
 
     def printer_temps(self) -> Dict[str, Any]:
         temps: Dict[str, Any] = {}
         for heater, data in self.heaters.items():
-            name = 'bed'
-            if heater.startswith('extruder'):
-                try:
-                    tool_no = int(heater[8:])
-                except ValueError:
-                    tool_no = 0
-                name = f'tool{tool_no}'
-            elif heater != "heater_bed":
+            name = _tool_id_for(heater)
+            if name is None:
                 continue
             temps[name] = {
                 'actual': round(data.get('temperature', 0.), 2),
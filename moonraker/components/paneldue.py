@@ -8,12 +8,11 @@ from __future__ import annotations
 import serial
 import os
 import time
-import json
 import errno
 import logging
 import asyncio
 from collections import deque
-from utils import ServerError
+from utils import ServerError, json_dumps
 
 # Annotation imports
 from typing import (
@@ -43,6 +42,7 @@ class PanelDueError(ServerError):
 
 
 RESTART_GCODES = ["RESTART", "FIRMWARE_RESTART"]
+ARG_GCODES = {"M23", "M30", "M32", "M36", "M37", "M98"}
 
 class SerialConnection:
     def __init__(self,
@@ -180,6 +180,8 @@ class PanelDue:
         self.last_gcode_response: Optional[str] = None
         self.current_file: str = ""
         self.file_metadata: Dict[str, Any] = {}
+        self.inv_filament_total: Optional[float] = None
+        self.inv_object_height: Optional[float] = None
         self.enable_checksum = config.getboolean('enable_checksum', True)
         self.debug_queue: Deque[str] = deque(maxlen=100)
 
@@ -189,14 +191,15 @@ class PanelDue:
             'fan': {}, 'display_status': {}, 'print_stats': {},
             'idle_timeout': {}, 'gcode_macro PANELDUE_BEEP': {}}
         self.extruder_count: int = 0
+        self.tool_indices: Dict[str, int] = {}
         self.heaters: List[str] = []
         self.is_ready: bool = False
         self.is_shutdown: bool = False
         self.initialized: bool = False
         self.cq_busy: bool = False
         self.gq_busy: bool = False
-        self.command_queue: List[Tuple[FlexCallback, Any, Any]] = []
-        self.gc_queue: List[str] = []
+        self.command_queue: Deque[Tuple[FlexCallback, Any, Any]] = deque()
+        self.gc_queue: Deque[str] = deque()
         self.last_printer_state: str = 'O'
         self.last_update_time: float = 0.
 
@@ -305,6 +308,7 @@ class PanelDue:
             'idle_timeout': {}, 'gcode_macro PANELDUE_BEEP': {}}
         sub_args = {k: None for k in self.printer_state.keys()}
         self.extruder_count = 0
+        self.tool_indices = {}
         self.heaters = []
         extruders = []
         for cfg in config:
@@ -313,6 +317,10 @@ class PanelDue:
                 self.printer_state[cfg] = {}
                 extruders.append(cfg)
                 sub_args[cfg] = None
+                if cfg == "extruder":
+                    self.tool_indices[cfg] = 0
+                elif cfg[-1].isdigit():
+                    self.tool_indices[cfg] = int(cfg[-1])
             elif cfg == "heater_bed":
                 self.printer_state[cfg] = {}
                 self.heaters.append(cfg)
@@ -396,8 +404,8 @@ class PanelDue:
         # Execute the gcode.  Check for special RRF gcodes that
         # require special handling
         parts = script.split()
-        cmd = parts[0].strip()
-        if cmd in ["M23", "M30", "M32", "M36", "M37", "M98"]:
+        cmd = parts[0]
+        if cmd in ARG_GCODES:
             arg = script[len(cmd):].strip()
             parts = [cmd, arg]
 
@@ -439,7 +447,7 @@ class PanelDue:
 
     async def _process_gcode_queue(self) -> None:
         while self.gc_queue:
-            script = self.gc_queue.pop(0)
+            script = self.gc_queue.popleft()
             try:
                 if script in RESTART_GCODES:
                     await self.klippy_apis.do_restart(script)
@@ -459,7 +467,7 @@ class PanelDue:
 
     async def _process_command_queue(self) -> None:
         while self.command_queue:
-            cmd, args, kwargs = self.command_queue.pop(0)
+            cmd, args, kwargs = self.command_queue.popleft()
             try:
                 ret = cmd(*args, **kwargs)
                 if ret is not None:
@@ -550,8 +558,7 @@ class PanelDue:
                     return
 
     def write_response(self, response: Dict[str, Any]) -> None:
-        byte_resp = json.dumps(response) + "\r\n"
-        self.ser_conn.send(byte_resp.encode())
+        self.ser_conn.send(json_dumps(response) + b"\r\n")
 
     def _get_printer_status(self) -> str:
         # PanelDue States applicable to Klipper:
@@ -644,6 +651,7 @@ class PanelDue:
             if self.current_file != fname:
                 self.current_file = fname
                 self.file_metadata = self.file_manager.get_file_metadata(fname)
+                self._set_progress_estimates()
             progress: float = sd_status.get('progress', 0)
             # progress and print tracking
             if progress:
@@ -653,20 +661,18 @@ class PanelDue:
                     # file read estimate
                     times_left = [int(est_time - est_time * progress)]
                     # filament estimate
-                    est_total_fil: Optional[float]
-                    est_total_fil = self.file_metadata.get('filament_total')
-                    if est_total_fil:
+                    inv_fil = self.inv_filament_total
+                    if inv_fil is not None:
                         cur_filament: float = print_stats.get(
                             'filament_used', 0.)
-                        fpct = min(1., cur_filament / est_total_fil)
+                        fpct = min(1., cur_filament * inv_fil)
                         times_left.append(int(est_time - est_time * fpct))
                     # object height estimate
-                    obj_height: Optional[float]
-                    obj_height = self.file_metadata.get('object_height')
-                    if obj_height:
+                    inv_height = self.inv_object_height
+                    if inv_height is not None:
                         cur_height: float = p_state['gcode_move'].get(
                             'gcode_position', [0., 0., 0., 0.])[2]
-                        hpct = min(1., cur_height / obj_height)
+                        hpct = min(1., cur_height * inv_height)
                         times_left.append(int(est_time - est_time * hpct))
                 else:
                     # The estimated time is not in the metadata, however we
@@ -678,6 +684,7 @@ class PanelDue:
             # clear filename and metadata
             self.current_file = ""
             self.file_metadata = {}
+            self._set_progress_estimates()
 
         fan_speed: Optional[float] = p_state['fan'].get('speed')
         if fan_speed is not None:
@@ -687,28 +694,39 @@ class PanelDue:
         if self.extruder_count > 0:
             extruder_name = p_state['toolhead'].get('extruder', "")
             if extruder_name:
-                tool = 0
-                if extruder_name != "extruder":
-                    tool = int(extruder_name[-1])
-                response['tool'] = tool
+                response['tool'] = self.tool_indices.get(extruder_name, 0)
 
         # Report Heater Status
         efactor: float = round(p_state['gcode_move'].get(
             'extrude_factor', 1.) * 100., 2)
 
-        for name in self.heaters:
-            temp: float = round(p_state[name].get('temperature', 0.0), 1)
-            target: float = round(p_state[name].get('target', 0.0), 1)
-            response.setdefault('heaters', []).append(temp)
-            response.setdefault('active', []).append(target)
-            response.setdefault('standby', []).append(target)
-            if name.startswith('extruder'):
-                a_stat = 2 if name == extruder_name else 1
-                response.setdefault('hstat', []).append(a_stat if target else 0)
-                response.setdefault('efactor', []).append(efactor)
-                response.setdefault('extr', []).append(round(pos[3], 2))
-            else:
-                response.setdefault('hstat', []).append(2 if target else 0)
+        if self.heaters:
+            temps: List[float] = []
+            targets: List[float] = []
+            hstat: List[int] = []
+            efactors: List[float] = []
+            extr: List[float] = []
+            extr_pos = round(pos[3], 2)
+            for name in self.heaters:
+                heater: Dict[str, Any] = p_state[name]
+                temp: float = round(heater.get('temperature', 0.0), 1)
+                target: float = round(heater.get('target', 0.0), 1)
+                temps.append(temp)
+                targets.append(target)
+                if name.startswith('extruder'):
+                    a_stat = 2 if name == extruder_name else 1
+                    hstat.append(a_stat if target else 0)
+                    efactors.append(efactor)
+                    extr.append(extr_pos)
+                else:
+                    hstat.append(2 if target else 0)
+            response['heaters'] = temps
+            response['active'] = targets
+            response['standby'] = targets
+            response['hstat'] = hstat
+            if efactors:
+                response['efactor'] = efactors
+                response['extr'] = extr
 
         # Display message (via M117)
         msg: str = p_state['display_status'].get('message', "")
@@ -720,6 +738,16 @@ class PanelDue:
         self.last_message = msg
         self.write_response(response)
 
+    def _set_progress_estimates(self) -> None:
+        # The filament and object height estimates are reported on
+        # every M408, store their inverses when the metadata changes
+        est_total_fil: Optional[float]
+        est_total_fil = self.file_metadata.get('filament_total')
+        self.inv_filament_total = 1. / est_total_fil if est_total_fil else None
+        obj_height: Optional[float]
+        obj_height = self.file_metadata.get('object_height')
+        self.inv_object_height = 1. / obj_height if obj_height else None
+
     def _run_paneldue_M20(self, arg_p: str, arg_s: int = 0) -> None:
         response_type = arg_s
         if response_type != 2:
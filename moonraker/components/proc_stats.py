@@ -41,6 +41,9 @@ REPORT_QUEUE_SIZE = 30
 THROTTLE_CHECK_INTERVAL = 10
 WATCHDOG_REFRESH_TIME = 2.
 REPORT_BLOCKED_TIME = 4.
+RSS_PATTERN = re.compile(r"Rss:\s+(\d+)\s+(\w+)")
+NET_DEV_PATTERN = re.compile(r"([\w]+):(.+)")
+CPU_STAT_PATTERN = re.compile(r"cpu[^\n]+")
 
 THROTTLED_FLAGS = {
     1: "Under-Voltage Detected",
@@ -208,7 +211,7 @@ class ProcStats:
     def _get_memory_usage(self) -> Tuple[Optional[int], Optional[str]]:
         try:
             mem_data = self.smaps.read_text()
-            rss_match = re.search(r"Rss:\s+(\d+)\s+(\w+)", mem_data)
+            rss_match = RSS_PATTERN.search(mem_data)
             if rss_match is None:
                 return None, None
             mem = int(rss_match.group(1))
@@ -229,7 +232,7 @@ class ProcStats:
         net_stats: Dict[str, Any] = {}
         try:
             ret = self.netdev_file.read_text()
-            dev_info = re.findall(r"([\w]+):(.+)", ret)
+            dev_info = NET_DEV_PATTERN.findall(ret)
             for (dev_name, stats) in dev_info:
                 parsed_stats = stats.strip().split()
                 net_stats[dev_name] = {
@@ -244,11 +247,11 @@ class ProcStats:
         try:
             cpu_usage: Dict[str, Any] = {}
             ret = self.cpu_stats_file.read_text()
-            usage_info: List[str] = re.findall(r"cpu[^\n]+", ret)
+            usage_info: List[str] = CPU_STAT_PATTERN.findall(ret)
             for cpu in usage_info:
                 parts = cpu.split()
                 name = parts[0]
-                cpu_sum = sum([int(t) for t in parts[1:]])
+                cpu_sum = sum(map(int, parts[1:]))
                 cpu_idle = int(parts[4])
                 if name in self.last_cpu_stats:
                     last_sum, last_idle = self.last_cpu_stats[name]
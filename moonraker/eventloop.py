@@ -18,6 +18,12 @@ from typing import (
     Union
 )
 
+HAS_UVLOOP = True
+try:
+    import uvloop
+except ImportError:
+    HAS_UVLOOP = False
+
 if TYPE_CHECKING:
     _T = TypeVar("_T")
     FlexCallback = Callable[..., Optional[Awaitable]]
@@ -28,6 +34,23 @@ class EventLoop:
     def __init__(self) -> None:
         self.reset()
 
+    @staticmethod
+    def install_uvloop() -> bool:
+        # Replace the default event loop policy with uvloop's when it
+        # is installed.  This must be called before the EventLoop is
+        # created, loops created after a restart use the same policy.
+        # The policy is process wide, so it is only installed by the
+        # command line entry point.
+        if not HAS_UVLOOP:
+            return False
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        return True
+
+    @staticmethod
+    def using_uvloop() -> bool:
+        return HAS_UVLOOP and isinstance(
+            asyncio.get_event_loop_policy(), uvloop.EventLoopPolicy)
+
     def reset(self) -> None:
         self.aioloop = asyncio.get_event_loop()
         self.add_signal_handler = self.aioloop.add_signal_handler
@@ -98,6 +121,7 @@ class FlexTimer:
                  callback: TimerCallback
                  ) -> None:
         self.eventloop = eventloop
+        self.get_loop_time = eventloop.get_loop_time
         self.callback = callback
         self.timer_handle: Optional[asyncio.TimerHandle] = None
         self.running: bool = False
@@ -106,7 +130,7 @@ class FlexTimer:
         if self.running:
             return
         self.running = True
-        call_time = self.eventloop.get_loop_time() + delay
+        call_time = self.get_loop_time() + delay
         self.timer_handle = self.eventloop.call_at(
             call_time, self._schedule_task)
 
@@ -128,7 +152,7 @@ class FlexTimer:
     async def _call_wrapper(self):
         if not self.running:
             return
-        ret = self.callback(self.eventloop.get_loop_time())
+        ret = self.callback(self.get_loop_time())
         if isinstance(ret, Awaitable):
             ret = await ret
         if self.running:
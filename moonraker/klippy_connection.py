@@ -8,12 +8,14 @@
 from __future__ import annotations
 import os
 import time
-import logging
 import json
+import logging
 import getpass
+import inspect
 import confighelper
 import asyncio
-from utils import ServerError
+from collections import deque
+from utils import ServerError, json_dumps
 
 # Annotation imports
 from typing import (
@@ -26,6 +28,7 @@ from typing import (
     Dict,
     List,
     Set,
+    Deque,
 )
 if TYPE_CHECKING:
     from app import MoonrakerApp
@@ -39,6 +42,7 @@ INIT_TIME = .25
 LOG_ATTEMPT_INTERVAL = int(2. / INIT_TIME + .5)
 MAX_LOG_ATTEMPTS = 10 * LOG_ATTEMPT_INTERVAL
 UNIX_BUFFER_LIMIT = 2 * 1024 * 1024
+MAX_WRITE_SIZE = 64 * 1024
 
 class KlippyConnection:
     def __init__(self, config: confighelper.ConfigHelper) -> None:
@@ -46,6 +50,8 @@ class KlippyConnection:
         self.uds_address: str = config.get(
             'klippy_uds_address', "/tmp/klippy_uds")
         self.writer: Optional[asyncio.StreamWriter] = None
+        self.write_buffer: Deque[KlippyRequest] = deque()
+        self.write_busy: bool = False
         self.connection_mutex: asyncio.Lock = asyncio.Lock()
         self.event_loop = self.server.get_event_loop()
         self.log_no_access = True
@@ -126,6 +132,9 @@ class KlippyConnection:
                 continue
             errors_remaining = 10
             try:
+                # Klippy encodes with the standard library, which may
+                # emit NaN and Infinity.  orjson rejects those, so
+                # decode with the json module.
                 decoded_cmd = json.loads(data[:-1])
                 self._process_command(decoded_cmd)
             except Exception:
@@ -135,25 +144,73 @@ class KlippyConnection:
             logging.debug("Klippy Disconnection From _read_stream()")
             await self.close()
 
-    async def _write_request(self, request: KlippyRequest) -> None:
-        if self.writer is None or self.closing:
-            self.pending_requests.pop(request.id, None)
-            request.notify(ServerError("Klippy Host not connected", 503))
+    def _queue_request(self, request: KlippyRequest) -> None:
+        self.write_buffer.append(request)
+        if self.write_busy:
             return
-        data = json.dumps(request.to_dict()).encode() + b"\x03"
+        self.write_busy = True
+        self.event_loop.register_callback(self._write_requests)
+
+    async def _write_requests(self) -> None:
+        # Requests queued during the same event loop iteration are
+        # coalesced into a single write.  This is possible because
+        # each request is terminated by the ETX character.
+        write_buffer = self.write_buffer
+        popleft = write_buffer.popleft
         try:
-            self.writer.write(data)
-            await self.writer.drain()
-        except asyncio.CancelledError:
-            self.pending_requests.pop(request.id, None)
-            request.notify(ServerError("Klippy Write Request Cancelled", 503))
-            raise
-        except Exception:
-            self.pending_requests.pop(request.id, None)
-            request.notify(ServerError("Klippy Write Request Error", 503))
-            if not self.closing:
-                logging.debug("Klippy Disconnection From _write_request()")
-                await self.close()
+            while write_buffer:
+                writer = self.writer
+                if writer is None or self.closing:
+                    for request in write_buffer:
+                        self.pending_requests.pop(request.id, None)
+                        request.notify(
+                            ServerError("Klippy Host not connected", 503))
+                    write_buffer.clear()
+                    break
+                batch: List[KlippyRequest] = []
+                chunks: List[bytes] = []
+                size = 0
+                while write_buffer and size < MAX_WRITE_SIZE:
+                    request = popleft()
+                    try:
+                        data = json_dumps(request.to_dict()) + b"\x03"
+                    except Exception:
+                        self.pending_requests.pop(request.id, None)
+                        request.notify(
+                            ServerError("Klippy Request Encoding Error", 400))
+                        continue
+                    batch.append(request)
+                    chunks.append(data)
+                    size += len(data)
+                if not chunks:
+                    continue
+                try:
+                    writer.write(b"".join(chunks))
+                    await writer.drain()
+                except asyncio.CancelledError:
+                    for request in batch:
+                        self.pending_requests.pop(request.id, None)
+                        request.notify(
+                            ServerError("Klippy Write Request Cancelled", 503))
+                    raise
+                except Exception:
+                    for request in batch:
+                        self.pending_requests.pop(request.id, None)
+                        request.notify(
+                            ServerError("Klippy Write Request Error", 503))
+                    if not self.closing:
+                        logging.debug(
+                            "Klippy Disconnection From _write_requests()")
+                        await self.close()
+        finally:
+            self.write_busy = False
+            # The buffer is only non-empty here if the task was cancelled,
+            # fail the remaining requests rather than leave them waiting
+            for request in write_buffer:
+                self.pending_requests.pop(request.id, None)
+                request.notify(
+                    ServerError("Klippy Write Request Cancelled", 503))
+            write_buffer.clear()
 
     def register_remote_method(self,
                                method_name: str,
@@ -349,12 +406,27 @@ class KlippyConnection:
         method = cmd.get('method', None)
         if method is not None:
             # This is a remote method called from klippy
-            if method in self.remote_methods:
+            cb = self.remote_methods.get(method)
+            if cb is None:
+                logging.info(f"Unknown method received: {method}")
+            elif inspect.iscoroutinefunction(cb):
                 params = cmd.get('params', {})
                 self.event_loop.register_callback(
                     self._execute_method, method, **params)
             else:
-                logging.info(f"Unknown method received: {method}")
+                # Synchronous methods, such as status updates, are
+                # called inline rather than scheduling a task for
+                # every message received
+                params = cmd.get('params', {})
+                try:
+                    ret = cb(**params)
+                except Exception:
+                    logging.exception(
+                        f"Error running remote method: {method}")
+                else:
+                    if ret is not None:
+                        self.event_loop.register_callback(
+                            self._await_method, method, ret)
             return
         # This is a response to a request, process
         req_id = cmd.get('id', None)
@@ -382,6 +454,12 @@ class KlippyConnection:
         except Exception:
             logging.exception(f"Error running remote method: {method_name}")
 
+    async def _await_method(self, method_name: str, ret: Awaitable) -> None:
+        try:
+            await ret
+        except Exception:
+            logging.exception(f"Error running remote method: {method_name}")
+
     def _process_gcode_response(self, response: str) -> None:
         self.server.send_event("server:gcode_response", response)
 
@@ -399,14 +477,20 @@ class KlippyConnection:
                 self._state = state
         for conn, sub in self.subscriptions.items():
             conn_status: Dict[str, Any] = {}
-            for name, fields in sub.items():
-                if name in status:
-                    val: Dict[str, Any] = dict(status[name])
-                    if fields is not None:
-                        val = {k: v for k, v in val.items() if k in fields}
-                    if val:
-                        conn_status[name] = val
-            conn.send_status(conn_status, eventtime)
+            # Klippy only reports objects that changed, so walk the
+            # update rather than the full subscription
+            for name, obj in status.items():
+                if name not in sub:
+                    continue
+                fields = sub[name]
+                if fields is None:
+                    val: Dict[str, Any] = dict(obj)
+                else:
+                    val = {k: v for k, v in obj.items() if k in fields}
+                if val:
+                    conn_status[name] = val
+            if conn_status:
+                conn.send_status(conn_status, eventtime)
 
     async def request(self, web_request: WebRequest) -> Any:
         if not self.is_connected():
@@ -474,7 +558,7 @@ class KlippyConnection:
         # Create a base klippy request
         base_request = KlippyRequest(rpc_method, args)
         self.pending_requests[base_request.id] = base_request
-        self.event_loop.register_callback(self._write_request, base_request)
+        self._queue_request(base_request)
         return await base_request.wait()
 
     def remove_subscription(self, conn: Subscribable) -> None:
@@ -523,6 +607,8 @@ class KlippyConnection:
 
 # Basic KlippyRequest class, easily converted to dict for json encoding
 class KlippyRequest:
+    __slots__ = ("id", "rpc_method", "params", "_event", "response")
+
     def __init__(self, rpc_method: str, params: Dict[str, Any]) -> None:
         self.id = id(self)
         self.rpc_method = rpc_method
@@ -421,6 +421,8 @@ def main(cmd_line_args: argparse.Namespace) -> None:
 
     # Start asyncio event loop and server
     event_loop = EventLoop()
+    if EventLoop.using_uvloop():
+        logging.info("Using uvloop event loop")
     alt_config_loaded = False
     estatus = 0
     while True:
@@ -500,4 +502,5 @@ if __name__ == '__main__':
     parser.add_argument(
         "-n", "--nologfile", action='store_true',
         help="disable logging to a file")
+    EventLoop.install_uvloop()
     main(parser.parse_args())
@@ -29,11 +29,18 @@ from typing import (
     Tuple,
     Dict,
     Any,
+    Callable,
 )
 
 if TYPE_CHECKING:
     from types import ModuleType
 
+HAS_ORJSON = True
+try:
+    import orjson
+except ImportError:
+    HAS_ORJSON = False
+
 MOONRAKER_PATH = os.path.join(os.path.dirname(__file__), '..')
 SYS_MOD_PATHS = glob.glob("/usr/lib/python3*/dist-packages")
 SYS_MOD_PATHS += glob.glob("/usr/lib/python3*/site-packages")
@@ -53,6 +60,28 @@ class SentinelClass:
             SentinelClass._instance = SentinelClass()
         return SentinelClass._instance
 
+
+# JSON encoding helpers.  The orjson module is used when available,
+# falling back to the standard library's json module.  Encoding
+# always returns bytes.  Note that orjson encodes NaN and Infinity
+# as null, and decodes integers wider than 64 bits as floats.
+json_loads: Callable[..., Any]
+if HAS_ORJSON:
+    def json_dumps(obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+        except orjson.JSONEncodeError:
+            # orjson rejects some objects the json module accepts,
+            # such as integers wider than 64 bits
+            return json.dumps(obj).encode()
+
+    json_loads = orjson.loads
+else:
+    def json_dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+    json_loads = json.loads
+
 # Coroutine friendly QueueHandler courtesy of Martjin Pieters:
 # https://www.zopatista.com/python/2019/05/11/asyncio-logging/
 class LocalQueueHandler(logging.handlers.QueueHandler):
@@ -7,15 +7,16 @@
 from __future__ import annotations
 import logging
 import ipaddress
-import json
 import asyncio
+from collections import deque
 from tornado.websocket import WebSocketHandler, WebSocketClosedError
-from utils import ServerError, SentinelClass
+from utils import ServerError, SentinelClass, json_dumps, json_loads
 
 # Annotation imports
 from typing import (
     TYPE_CHECKING,
     Any,
+    Awaitable,
     Optional,
     Callable,
     Coroutine,
@@ -24,6 +25,7 @@ from typing import (
     Union,
     Dict,
     List,
+    Deque,
 )
 if TYPE_CHECKING:
     from moonraker import Server
@@ -49,6 +51,9 @@ class Subscribable:
         raise NotImplementedError
 
 class WebRequest:
+    __slots__ = (
+        "endpoint", "action", "args", "conn", "ip_addr", "current_user")
+
     def __init__(self,
                  endpoint: str,
                  args: Dict[str, Any],
@@ -162,16 +167,16 @@ class JsonRPC:
     async def dispatch(self,
                        data: str,
                        conn: Optional[WebSocket] = None
-                       ) -> Optional[str]:
+                       ) -> Optional[bytes]:
         response: Any = None
         try:
-            request: Union[Dict[str, Any], List[dict]] = json.loads(data)
+            request: Union[Dict[str, Any], List[dict]] = json_loads(data)
         except Exception:
             msg = f"{self.transport} data not json: {data}"
             logging.exception(msg)
             response = self.build_error(-32700, "Parse error")
-            return json.dumps(response)
-        logging.debug(f"{self.transport} Request::{data}")
+            return json_dumps(response)
+        logging.debug("%s Request::%s", self.transport, data)
         if isinstance(request, list):
             response = []
             for req in request:
@@ -183,8 +188,10 @@ class JsonRPC:
         else:
             response = await self.process_request(request, conn)
         if response is not None:
-            response = json.dumps(response)
-            logging.debug(f"{self.transport} Response::{response}")
+            response = json_dumps(response)
+            if logging.root.isEnabledFor(logging.DEBUG):
+                logging.debug(
+                    f"{self.transport} Response::{response.decode()}")
         return response
 
     async def process_request(self,
@@ -401,13 +408,13 @@ class WebsocketManager(APITransport):
 
     def add_websocket(self, ws: WebSocket) -> None:
         self.websockets[ws.uid] = ws
-        logging.debug(f"New Websocket Added: {ws.uid}")
+        logging.debug("New Websocket Added: %s", ws.uid)
 
     def remove_websocket(self, ws: WebSocket) -> None:
         old_ws = self.websockets.pop(ws.uid, None)
         if old_ws is not None:
             self.klippy.remove_subscription(old_ws)
-            logging.debug(f"Websocket Removed: {ws.uid}")
+            logging.debug("Websocket Removed: %s", ws.uid)
         if self.closed_event is not None and not self.websockets:
             self.closed_event.set()
 
@@ -415,11 +422,19 @@ class WebsocketManager(APITransport):
                           name: str,
                           data: Any = SENTINEL
                           ) -> None:
+        if not self.websockets:
+            return
         msg: Dict[str, Any] = {'jsonrpc': "2.0", 'method': "notify_" + name}
         if data != SENTINEL:
             msg['params'] = [data]
+        # Notifications are identical for every client, encode once
+        try:
+            payload = json_dumps(msg)
+        except Exception:
+            logging.exception(f"Error encoding notification: {name}")
+            return
         for ws in list(self.websockets.values()):
-            ws.queue_message(msg)
+            ws.queue_message(payload)
 
     def get_count(self) -> int:
         return len(self.websockets)
@@ -440,14 +455,16 @@ class WebSocket(WebSocketHandler, Subscribable):
     def initialize(self) -> None:
         self.server: Server = self.settings['server']
         self.event_loop = self.server.get_event_loop()
+        self.get_loop_time = self.event_loop.get_loop_time
         self.wsm: WebsocketManager = self.server.lookup_component("websockets")
         self.rpc = self.wsm.rpc
         self.uid = id(self)
         self.is_closed: bool = False
         self.ip_addr: str = self.request.remote_ip
         self.queue_busy: bool = False
-        self.message_buf: List[Union[str, Dict[str, Any]]] = []
-        self.last_pong_time: float = self.event_loop.get_loop_time()
+        self.message_buf: Deque[Union[bytes, str, Dict[str, Any]]] = deque()
+        self.pending_status: Optional[Dict[str, Any]] = None
+        self.last_pong_time: float = self.get_loop_time()
         self._connected_time: float = 0.
         self._client_data: Dict[str, str] = {}
 
@@ -469,7 +486,7 @@ class WebSocket(WebSocketHandler, Subscribable):
 
     def open(self, *args, **kwargs) -> None:
         self.set_nodelay(True)
-        self._connected_time = self.event_loop.get_loop_time()
+        self._connected_time = self.get_loop_time()
         agent = self.request.headers.get("User-Agent", "")
         is_proxy = False
         if (
@@ -487,7 +504,7 @@ class WebSocket(WebSocketHandler, Subscribable):
         self.event_loop.register_callback(self._process_message, message)
 
     def on_pong(self, data: bytes) -> None:
-        self.last_pong_time = self.event_loop.get_loop_time()
+        self.last_pong_time = self.get_loop_time()
 
     async def _process_message(self, message: str) -> None:
         try:
@@ -497,7 +514,9 @@ class WebSocket(WebSocketHandler, Subscribable):
         except Exception:
             logging.exception("Websocket Command Error")
 
-    def queue_message(self, message: Union[str, Dict[str, Any]]):
+    def queue_message(self, message: Union[bytes, str, Dict[str, Any]]):
+        if self.is_closed:
+            return
         self.message_buf.append(message)
         if self.queue_busy:
             return
@@ -506,38 +525,79 @@ class WebSocket(WebSocketHandler, Subscribable):
 
     async def _process_messages(self):
         if self.is_closed:
-            self.message_buf = []
+            self.message_buf.clear()
             self.queue_busy = False
             return
-        while self.message_buf:
-            msg = self.message_buf.pop(0)
-            try:
-                await self.write_message(msg)
-            except WebSocketClosedError:
+        message_buf = self.message_buf
+        while message_buf and not self.is_closed:
+            # Hand every queued message to the stream before waiting,
+            # so a backlog is flushed with a single wait rather than
+            # one wait per message
+            write_futs: List[Awaitable] = []
+            closed = False
+            while message_buf:
+                msg = message_buf.popleft()
+                try:
+                    if isinstance(msg, dict):
+                        msg = json_dumps(msg)
+                    write_futs.append(self.write_message(msg))
+                except WebSocketClosedError:
+                    closed = True
+                    break
+                except Exception:
+                    logging.exception(
+                        f"Error sending data over websocket: {self.uid}")
+            results = await asyncio.gather(
+                *write_futs, return_exceptions=True)
+            for result in results:
+                if isinstance(result, WebSocketClosedError):
+                    closed = True
+                elif isinstance(result, Exception):
+                    logging.error(
+                        f"Error sending data over websocket: {self.uid}",
+                        exc_info=result)
+            if closed:
                 self.is_closed = True
+                message_buf.clear()
                 logging.info(
                     f"Websocket closed while writing: {self.uid}")
-                break
-            except Exception:
-                logging.exception(
-                    f"Error sending data over websocket: {self.uid}")
         self.queue_busy = False
 
     def send_status(self,
                     status: Dict[str, Any],
                     eventtime: float
                     ) -> None:
-        if not status:
+        if not status or self.is_closed:
+            return
+        pending = self.pending_status
+        if (
+            pending is not None and
+            self.message_buf and
+            self.message_buf[-1] is pending
+        ):
+            # The previous status update has not been sent, merge the
+            # new status into it so only the latest values are sent
+            pending_status: Dict[str, Any] = pending['params'][0]
+            for obj, fields in status.items():
+                if obj in pending_status:
+                    merged = dict(pending_status[obj])
+                    merged.update(fields)
+                    pending_status[obj] = merged
+                else:
+                    pending_status[obj] = fields
+            pending['params'][1] = eventtime
             return
-        self.queue_message({
+        self.pending_status = {
             'jsonrpc': "2.0",
             'method': "notify_status_update",
-            'params': [status, eventtime]})
+            'params': [status, eventtime]}
+        self.queue_message(self.pending_status)
 
     def on_close(self) -> None:
         self.is_closed = True
-        self.message_buf = []
-        now = self.event_loop.get_loop_time()
+        self.message_buf.clear()
+        self.pending_status = None
+        now = self.get_loop_time()
         pong_elapsed = now - self.last_pong_time
         logging.info(f"Websocket Closed: ID: {self.uid} "
                      f"Close Code: {self.close_code}, "
@@ -1,17 +1,19 @@
 from __future__ import annotations
 import asyncio
+from typing import Any, Callable, Coroutine, List, Tuple
 from utils import ServerError
 from .mock_gpio import MockGpiod
 
 __all__ = ("MockReader", "MockWriter", "MockComponent", "MockWebsocket",
-           "MockGpiod")
+           "MockGpiod", "MockEventLoop", "MockInotifyHandler")
 
 class MockWriter:
     def __init__(self, wait_drain: bool = False) -> None:
         self.wait_drain = wait_drain
+        self.written: List[bytes] = []
 
-    def write(self, data: str) -> None:
-        pass
+    def write(self, data: bytes) -> None:
+        self.written.append(data)
 
     async def drain(self) -> None:
         if self.wait_drain:
@@ -21,8 +23,12 @@ class MockWriter:
             raise ServerError("TestError")
 
 class MockReader:
-    def __init__(self, action: str = "") -> None:
+    def __init__(self,
+                 action: str = "",
+                 data: bytes = b"NotJsonDecodable"
+                 ) -> None:
         self.action = action
+        self.data = data
         self.eof = False
 
     def at_eof(self) -> bool:
@@ -37,7 +43,7 @@ class MockReader:
             raise ServerError("TestError")
         else:
             self.eof = True
-            return b"NotJsonDecodable"
+            return self.data
 
 
 class MockComponent:
@@ -66,5 +72,72 @@ class MockWebsocket:
     def __init__(self, fut: asyncio.Future) -> None:
         self.future = fut
 
-    def queue_message(self, data: str):
+    def queue_message(self, data: bytes):
         self.future.set_result(data)
+
+class MockTimer:
+    def __init__(self, when: float, callback: Callable, args: Tuple) -> None:
+        self._when = when
+        self.callback = callback
+        self.args = args
+        self._cancelled = False
+
+    def when(self) -> float:
+        return self._when
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def cancelled(self) -> bool:
+        return self._cancelled
+
+class MockEventLoop:
+    # Timers run against a clock that only moves when advance() is
+    # called, tasks are passed to the running asyncio loop
+    def __init__(self) -> None:
+        self.time = 0.
+        self.timers: List[MockTimer] = []
+
+    def get_loop_time(self) -> float:
+        return self.time
+
+    def delay_callback(self, delay: float, callback: Callable, *args):
+        timer = MockTimer(self.time + delay, callback, args)
+        self.timers.append(timer)
+        return timer
+
+    def create_task(self, coro: Coroutine) -> asyncio.Task:
+        return asyncio.get_event_loop().create_task(coro)
+
+    def advance(self, delay: float) -> None:
+        end = self.time + delay
+        while True:
+            pending = [t for t in self.timers if not t.cancelled()]
+            due = [t for t in pending if t.when() <= end]
+            self.timers = pending
+            if not due:
+                break
+            timer = min(due, key=lambda t: t.when())
+            self.timers.remove(timer)
+            self.time = max(self.time, timer.when())
+            timer.callback(*timer.args)
+        self.time = end
+
+class MockInotifyHandler:
+    def __init__(self) -> None:
+        self.event_loop = MockEventLoop()
+        self.notifications: List[Tuple[Any, ...]] = []
+        self.next_wd = 1
+
+    def add_watch(self, node: Any) -> int:
+        self.next_wd += 1
+        return self.next_wd
+
+    def remove_watch(self, wdesc: int, need_low_level_rm: bool = True):
+        pass
+
+    def log_nodes(self) -> None:
+        pass
+
+    def notify_filelist_changed(self, action: str, *args) -> None:
+        self.notifications.append((action,) + args)
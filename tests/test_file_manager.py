@@ -0,0 +1,98 @@
+from __future__ import annotations
+import pytest
+import asyncio
+import pathlib
+from components.file_manager.file_manager import (
+    InotifyNode,
+    InotifyRootNode
+)
+from mocks import MockInotifyHandler
+
+from typing import Tuple
+
+NodeFixture = Tuple[MockInotifyHandler, InotifyNode]
+
+@pytest.fixture
+def inotify_node(tmp_path: pathlib.Path) -> NodeFixture:
+    tmp_path.joinpath("child").mkdir()
+    ihdlr = MockInotifyHandler()
+    root = InotifyRootNode(ihdlr, "config", str(tmp_path))
+    node = InotifyNode(ihdlr, root, "child")
+    root.add_child_node(node)
+    return ihdlr, node
+
+async def run_pending_tasks() -> None:
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+@pytest.mark.asyncio
+async def test_reset_pushes_deadline(inotify_node: NodeFixture):
+    ihdlr, node = inotify_node
+    loop = ihdlr.event_loop
+    node.add_event("create_node", 1.)
+    hdl = node.pending_node_events["create_node"]
+    loop.advance(.5)
+    node.reset_event("create_node", 1.)
+    # The armed timer is kept, only the deadline moves
+    assert node.pending_node_events["create_node"] is hdl
+    assert node.event_deadlines["create_node"] == 1.5
+    loop.advance(.5)
+    await run_pending_tasks()
+    # The timer fired early and re-armed itself for the remaining time
+    assert ihdlr.notifications == []
+    assert node.pending_node_events["create_node"].when() == 1.5
+    loop.advance(.5)
+    await run_pending_tasks()
+    assert ihdlr.notifications == [
+        ("create_dir", "config", node.get_path())]
+    assert not node.pending_node_events and not node.event_deadlines
+
+@pytest.mark.asyncio
+async def test_reset_after_stop(inotify_node: NodeFixture):
+    ihdlr, node = inotify_node
+    loop = ihdlr.event_loop
+    node.add_event("create_node", 1.)
+    node.stop_event("create_node")
+    loop.advance(2.)
+    await run_pending_tasks()
+    assert ihdlr.notifications == []
+    node.reset_event("create_node", 1.)
+    hdl = node.pending_node_events["create_node"]
+    assert not hdl.cancelled() and hdl.when() == 3.
+    loop.advance(1.)
+    await run_pending_tasks()
+    assert len(ihdlr.notifications) == 1
+
+@pytest.mark.asyncio
+async def test_reset_shorter_timeout(inotify_node: NodeFixture):
+    ihdlr, node = inotify_node
+    loop = ihdlr.event_loop
+    node.add_event("create_node", 5.)
+    prev_hdl = node.pending_node_events["create_node"]
+    node.reset_event("create_node", 1.)
+    hdl = node.pending_node_events["create_node"]
+    assert prev_hdl.cancelled() and hdl.when() == 1.
+    loop.advance(1.)
+    await run_pending_tasks()
+    assert len(ihdlr.notifications) == 1
+    loop.advance(5.)
+    await run_pending_tasks()
+    assert len(ihdlr.notifications) == 1
+
+@pytest.mark.asyncio
+async def test_reset_while_finish_pending(inotify_node: NodeFixture):
+    ihdlr, node = inotify_node
+    loop = ihdlr.event_loop
+    node.add_event("create_node", 1.)
+    # The timer fires and schedules _finish_create_node(), the reset
+    # arrives before that task runs
+    loop.advance(1.)
+    node.reset_event("create_node", 1.)
+    assert node.pending_node_events["create_node"].when() == 2.
+    await run_pending_tasks()
+    assert len(ihdlr.notifications) == 1
+    loop.advance(1.)
+    await run_pending_tasks()
+    # The create event was already reported, the extra timer is a no-op
+    assert len(ihdlr.notifications) == 1
+    assert not node.pending_node_events and not node.event_deadlines
@@ -2,7 +2,8 @@ from __future__ import annotations
 import pytest
 import asyncio
 import pathlib
-from typing import TYPE_CHECKING, Dict
+import math
+from typing import TYPE_CHECKING, Dict, List
 from moonraker import ServerError
 from klippy_connection import KlippyRequest
 from mocks import MockReader, MockWriter
@@ -171,7 +172,8 @@ async def test_no_uds_access(base_server: Server,
 async def test_write_not_connected(base_server: Server):
     req = KlippyRequest("", {})
     kconn = base_server.klippy_connection
-    await kconn._write_request(req)
+    kconn.write_buffer.append(req)
+    await kconn._write_requests()
     assert isinstance(req.response, ServerError)
 
 @pytest.mark.asyncio
@@ -179,19 +181,50 @@ async def test_write_error(base_server: Server):
     req = KlippyRequest("", {})
     kconn = base_server.klippy_connection
     kconn.writer = MockWriter()
-    await kconn._write_request(req)
+    kconn.write_buffer.append(req)
+    await kconn._write_requests()
     assert isinstance(req.response, ServerError)
 
+@pytest.mark.asyncio
+async def test_write_batched(base_server: Server):
+    reqs = [KlippyRequest("", {}) for _ in range(3)]
+    kconn = base_server.klippy_connection
+    writer = MockWriter()
+    kconn.writer = writer
+    kconn.write_buffer.extend(reqs)
+    await kconn._write_requests()
+    assert (
+        len(writer.written) == 1 and
+        writer.written[0].count(b"\x03") == 3
+    )
+
 @pytest.mark.asyncio
 async def test_write_cancelled(base_server: Server):
     req = KlippyRequest("", {})
     kconn = base_server.klippy_connection
     kconn.writer = MockWriter(wait_drain=True)
-    task = base_server.event_loop.create_task(kconn._write_request(req))
+    kconn.write_buffer.append(req)
+    task = base_server.event_loop.create_task(kconn._write_requests())
     base_server.event_loop.delay_callback(.01, task.cancel)
     with pytest.raises(asyncio.CancelledError):
         await task
 
+@pytest.mark.asyncio
+async def test_write_cancelled_pending(base_server: Server):
+    reqs = [KlippyRequest("", {}) for _ in range(2)]
+    kconn = base_server.klippy_connection
+    kconn.writer = MockWriter(wait_drain=True)
+    kconn.write_buffer.append(reqs[0])
+    kconn.write_busy = True
+    task = base_server.event_loop.create_task(kconn._write_requests())
+    await asyncio.sleep(.01)
+    kconn.write_buffer.append(reqs[1])
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert all(isinstance(r.response, ServerError) for r in reqs)
+    assert not kconn.write_buffer and not kconn.write_busy
+
 @pytest.mark.asyncio
 async def test_read_error(base_server: Server,
                           caplog: pytest.LogCaptureFixture):
@@ -218,6 +251,16 @@ async def test_read_decode_error(base_server: Server,
     await kconn._read_stream(mock_reader)
     assert "Error processing Klippy Host Response:" in caplog.messages[-1]
 
+@pytest.mark.asyncio
+async def test_read_non_finite_values(base_server: Server):
+    kconn = base_server.klippy_connection
+    req = KlippyRequest("objects/query", {})
+    kconn.pending_requests[req.id] = req
+    data = f'{{"id": {req.id}, "result": {{"value": NaN}}}}\x03'
+    mock_reader = MockReader(data=data.encode())
+    await kconn._read_stream(mock_reader)
+    assert math.isnan(req.response["value"])
+
 def test_process_unknown_method(base_server: Server,
                                 caplog: pytest.LogCaptureFixture):
     cmd = {"method": "test_unknown"}
@@ -225,6 +268,43 @@ def test_process_unknown_method(base_server: Server,
     kconn._process_command(cmd)
     assert "Unknown method received: test_unknown" == caplog.messages[-1]
 
+def test_process_sync_method(base_server: Server):
+    results: List[str] = []
+
+    def method_test(result):
+        results.append(result)
+    kconn = base_server.klippy_connection
+    kconn.register_remote_method("test_sync", method_test)
+    cmd = {"method": "test_sync", "params": {"result": "test"}}
+    kconn._process_command(cmd)
+    assert results == ["test"]
+
+def test_process_sync_method_error(base_server: Server,
+                                   caplog: pytest.LogCaptureFixture):
+    def method_test():
+        raise Exception("test error")
+    kconn = base_server.klippy_connection
+    kconn.register_remote_method("test_sync_error", method_test)
+    kconn._process_command({"method": "test_sync_error"})
+    expected = "Error running remote method: test_sync_error"
+    assert expected == caplog.messages[-1]
+
+@pytest.mark.asyncio
+async def test_process_sync_method_awaitable(base_server: Server):
+    fut = base_server.get_event_loop().create_future()
+
+    async def set_result(result):
+        fut.set_result(result)
+
+    def method_test(result):
+        return set_result(result)
+    kconn = base_server.klippy_connection
+    kconn.register_remote_method("test_awaitable", method_test)
+    cmd = {"method": "test_awaitable", "params": {"result": "test"}}
+    kconn._process_command(cmd)
+    ret = await asyncio.wait_for(fut, 1.)
+    assert ret == "test"
+
 def test_process_unknown_request(base_server: Server,
                                  caplog: pytest.LogCaptureFixture):
     cmd = {"id": 4543}
@@ -241,6 +321,30 @@ def test_process_invalid_request(base_server: Server):
     kconn._process_command(cmd)
     assert isinstance(req.response, ServerError)
 
+def test_process_status_update(base_server: Server):
+    class MockSubscriber:
+        def __init__(self):
+            self.updates = []
+
+        def send_status(self, status, eventtime):
+            self.updates.append(status)
+    kconn = base_server.klippy_connection
+    toolhead_sub = MockSubscriber()
+    fan_sub = MockSubscriber()
+    kconn.subscriptions[toolhead_sub] = {
+        "toolhead": ["position"], "extruder": None}
+    kconn.subscriptions[fan_sub] = {"fan": None}
+    status = {
+        "toolhead": {"position": [1., 2., 3., 4.], "max_velocity": 300.},
+        "extruder": {"temperature": 200.}
+    }
+    kconn._process_status_update(10., status)
+    assert toolhead_sub.updates == [{
+        "toolhead": {"position": [1., 2., 3., 4.]},
+        "extruder": {"temperature": 200.}
+    }]
+    assert fan_sub.updates == []
+
 # TODO: This can probably go in a class with test apis
 @pytest.mark.asyncio
 async def test_call_remote_method(base_server: Server,
@@ -3,13 +3,15 @@ import pytest
 import pytest_asyncio
 import asyncio
 import socket
+import json
 import pathlib
-from collections import namedtuple
+from collections import namedtuple, deque
 
 from moonraker import CORE_COMPONENTS, Server, API_VERSION
 from moonraker import main as servermain
 from eventloop import EventLoop
 from utils import ServerError
+from websockets import WebSocket
 from confighelper import ConfigError
 from components.klippy_apis import KlippyAPI
 from mocks import MockComponent, MockWebsocket
@@ -143,7 +145,66 @@ class TestInstantiation:
             'method': "notify_test_event",
             'params': ["test"]
         }
-        assert expected == ret
+        assert expected == json.loads(ret)
+
+    @pytest.mark.asyncio
+    async def test_notification_encode_error(self, base_server: Server):
+        base_server.register_notification("test:test_bad_event")
+        fut = base_server.event_loop.create_future()
+        wsm = base_server.lookup_component("websockets")
+        wsm.websockets[1] = MockWebsocket(fut)
+        evt_fut = base_server.send_event("test:test_bad_event", object())
+        await asyncio.wait_for(evt_fut, 1.)
+        assert not fut.done()
+
+class TestWebsocketStatus:
+    @pytest.fixture
+    def ws(self) -> WebSocket:
+        # Only the state used by send_status() is initialized.  The
+        # queue is marked busy so no flush is scheduled.
+        ws = WebSocket.__new__(WebSocket)
+        ws.is_closed = False
+        ws.queue_busy = True
+        ws.message_buf = deque()
+        ws.pending_status = None
+        return ws
+
+    def test_merge_unsent(self, ws: WebSocket):
+        ws.send_status({"toolhead": {"position": [1, 2, 3, 4]}}, 1.)
+        ws.send_status({"toolhead": {"homed_axes": "xyz"},
+                        "fan": {"speed": .5}}, 2.)
+        assert len(ws.message_buf) == 1
+        assert ws.message_buf[0] == {
+            'jsonrpc': "2.0",
+            'method': "notify_status_update",
+            'params': [
+                {
+                    "toolhead": {
+                        "position": [1, 2, 3, 4],
+                        "homed_axes": "xyz"
+                    },
+                    "fan": {"speed": .5}
+                },
+                2.
+            ]
+        }
+
+    def test_no_merge_after_queued(self, ws: WebSocket):
+        ws.send_status({"fan": {"speed": .5}}, 1.)
+        ws.queue_message({'jsonrpc': "2.0", 'method': "notify_test"})
+        ws.send_status({"fan": {"speed": 1.}}, 2.)
+        assert len(ws.message_buf) == 3
+        assert ws.message_buf[0]['params'] == [{"fan": {"speed": .5}}, 1.]
+        assert ws.message_buf[2]['params'] == [{"fan": {"speed": 1.}}, 2.]
+
+    def test_no_merge_after_flush(self, ws: WebSocket):
+        ws.send_status({"fan": {"speed": .5}}, 1.)
+        # Popping the update emulates the start of _process_messages()
+        sent = ws.message_buf.popleft()
+        ws.send_status({"fan": {"speed": 1.}}, 2.)
+        assert sent['params'] == [{"fan": {"speed": .5}}, 1.]
+        assert len(ws.message_buf) == 1
+        assert ws.message_buf[0]['params'] == [{"fan": {"speed": 1.}}, 2.]
 
 class TestLoadComponent:
     def test_load_component_fail(self, base_server: Server):